@@ -3,12 +3,19 @@
 
 from __future__ import annotations
 
-import copy
-import mimetypes
+import hashlib
+import mmap
+import os
 import re
+import shutil
+import time
 import zipfile
+from collections.abc import Iterable
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from typing import IO
+from xml.sax.saxutils import escape
+
+import lxml.etree as ET
 
 NS = {
     "office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
@@ -21,142 +28,246 @@ NS = {
     "form": "urn:oasis:names:tc:opendocument:xmlns:form:1.0",
 }
 
-for prefix, uri in NS.items():
-    ET.register_namespace(prefix, uri)
+IMAGE_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+)
+CHUNK_SIZE = 1 << 20
+
+CONTENT_PATH = "content.xml"
+MANIFEST_PATH = "META-INF/manifest.xml"
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+_FRAGMENT_XML = "<fragment " + " ".join(f'xmlns:{p}="{uri}"' for p, uri in NS.items()) + ">{}</fragment>"
+_TEXT_FRAME_XML = (
+    '<draw:frame presentation:style-name="{style_name}" draw:layer="layout" '
+    'svg:x="{x}" svg:y="{y}" svg:width="{w}" svg:height="{h}" '
+    'presentation:class="{pclass}" presentation:user-transformed="true">'
+    "<draw:text-box>{paragraphs}</draw:text-box>"
+    "</draw:frame>"
+)
+_IMAGE_FRAME_XML = (
+    '<draw:frame draw:style-name="gr1" draw:name="{name}" draw:layer="layout" '
+    'svg:x="{x}" svg:y="{y}" svg:width="{w}" svg:height="{h}">'
+    '<draw:image xlink:href="{href}" xlink:type="simple" xlink:show="embed" xlink:actuate="onLoad"/>'
+    "</draw:frame>"
+)
 
 
 def qn(prefix: str, tag: str) -> str:
     return f"{{{NS[prefix]}}}{tag}"
 
 
-def find_frame(page: ET.Element, pclass: str) -> ET.Element | None:
-    for frame in page.findall(qn("draw", "frame")):
-        if frame.get(qn("presentation", "class")) == pclass:
+_OFFICE_BODY = qn("office", "body")
+_OFFICE_PRESENTATION = qn("office", "presentation")
+
+_DRAW_FRAME = qn("draw", "frame")
+_DRAW_MASTER_PAGE_NAME = qn("draw", "master-page-name")
+_DRAW_NAME = qn("draw", "name")
+_DRAW_PAGE = qn("draw", "page")
+_DRAW_PAGE_NUMBER = qn("draw", "page-number")
+_DRAW_PAGE_THUMBNAIL = qn("draw", "page-thumbnail")
+_DRAW_STYLE_NAME = qn("draw", "style-name")
+_DRAW_TEXT_BOX = qn("draw", "text-box")
+
+_TEXT_P = qn("text", "p")
+
+_SVG_HEIGHT = qn("svg", "height")
+_SVG_WIDTH = qn("svg", "width")
+_SVG_X = qn("svg", "x")
+_SVG_Y = qn("svg", "y")
+
+_PRESENTATION_CLASS = qn("presentation", "class")
+_PRESENTATION_NOTES = qn("presentation", "notes")
+_PRESENTATION_SETTINGS = qn("presentation", "settings")
+
+_MANIFEST_FILE_ENTRY = qn("manifest", "file-entry")
+_MANIFEST_FULL_PATH = qn("manifest", "full-path")
+_MANIFEST_MEDIA_TYPE = qn("manifest", "media-type")
+_MANIFEST_VERSION = qn("manifest", "version")
+
+_NOTES_THUMBNAIL_PATH = f"{_PRESENTATION_NOTES}/{_DRAW_PAGE_THUMBNAIL}"
+
+
+def find_frame(page: ET._Element, pclass: str) -> ET._Element | None:
+    for frame in page.iterfind(_DRAW_FRAME):
+        if frame.get(_PRESENTATION_CLASS) == pclass:
             return frame
     return None
 
 
-def clear_textbox(frame: ET.Element) -> ET.Element:
-    textbox = frame.find(qn("draw", "text-box"))
+def get_textbox(frame: ET._Element) -> ET._Element:
+    textbox = frame.find(_DRAW_TEXT_BOX)
     if textbox is None:
-        textbox = ET.SubElement(frame, qn("draw", "text-box"))
+        textbox = ET.SubElement(frame, _DRAW_TEXT_BOX)
+    return textbox
+
+
+def clear_textbox(textbox: ET._Element) -> None:
     for child in list(textbox):
         textbox.remove(child)
-    return textbox
 
 
-def set_paragraphs(frame: ET.Element, lines: list[str]) -> None:
-    textbox = clear_textbox(frame)
+def set_paragraphs(frame: ET._Element, lines: Iterable[str]) -> None:
+    textbox = get_textbox(frame)
+    clear_textbox(textbox)
     for line in lines:
-        p = ET.SubElement(textbox, qn("text", "p"))
+        p = ET.SubElement(textbox, _TEXT_P)
         p.text = line
 
 
-def set_title(page: ET.Element, title: str) -> None:
-    frame = find_frame(page, "title")
+def bulleted(lines: Iterable[str]) -> Iterable[str]:
+    return ("• " + line for line in lines)
+
+
+def set_title(frame: ET._Element | None, title: str) -> None:
     if frame is None:
         raise RuntimeError("Title frame not found")
     set_paragraphs(frame, [title])
 
 
-def set_outline(page: ET.Element, lines: list[str]) -> None:
-    frame = find_frame(page, "outline")
+def set_outline(frame: ET._Element | None, lines: Iterable[str]) -> None:
     if frame is None:
         return
-    bullet_lines = [f"• {line}" for line in lines]
-    set_paragraphs(frame, bullet_lines)
+    set_paragraphs(frame, bulleted(lines))
 
 
-def set_subtitle(page: ET.Element, lines: list[str]) -> None:
-    frame = find_frame(page, "subtitle")
+def set_subtitle(frame: ET._Element | None, lines: list[str]) -> None:
     if frame is None:
         return
     set_paragraphs(frame, lines)
 
 
-def update_notes_page_number(page: ET.Element, page_no: int) -> None:
-    notes = page.find(qn("presentation", "notes"))
-    if notes is None:
-        return
-    thumb = notes.find(qn("draw", "page-thumbnail"))
+def update_notes_page_number(page: ET._Element, page_no: int) -> None:
+    thumb = page.find(_NOTES_THUMBNAIL_PATH)
     if thumb is None:
         return
-    thumb.set(qn("draw", "page-number"), str(page_no))
+    thumb.set(_DRAW_PAGE_NUMBER, str(page_no))
 
 
-def remove_outline_frame(page: ET.Element) -> None:
-    frame = find_frame(page, "outline")
+def remove_outline_frame(page: ET._Element, frame: ET._Element | None) -> None:
     if frame is not None:
         page.remove(frame)
 
 
-def add_text_frame(
-    page: ET.Element,
+def xml_attr(value: str) -> str:
+    return escape(value, {'"': "&quot;"})
+
+
+def text_frame_xml(
     style_name: str,
     pclass: str,
     x: str,
     y: str,
     w: str,
     h: str,
-    lines: list[str],
+    lines: Iterable[str],
     bullet: bool = False,
-) -> None:
-    frame = ET.SubElement(
-        page,
-        qn("draw", "frame"),
-        {
-            qn("presentation", "style-name"): style_name,
-            qn("draw", "layer"): "layout",
-            qn("svg", "x"): x,
-            qn("svg", "y"): y,
-            qn("svg", "width"): w,
-            qn("svg", "height"): h,
-            qn("presentation", "class"): pclass,
-            qn("presentation", "user-transformed"): "true",
-        },
-    )
+) -> str:
     if bullet:
-        lines = [f"• {line}" for line in lines]
-    set_paragraphs(frame, lines)
+        lines = bulleted(lines)
+    return _TEXT_FRAME_XML.format(
+        style_name=xml_attr(style_name),
+        pclass=xml_attr(pclass),
+        x=xml_attr(x),
+        y=xml_attr(y),
+        w=xml_attr(w),
+        h=xml_attr(h),
+        paragraphs="".join(f"<text:p>{escape(line)}</text:p>" for line in lines),
+    )
 
 
-def add_image_frame(
-    page: ET.Element,
+def image_frame_xml(
     href: str,
     x: str,
     y: str,
     w: str,
     h: str,
     name: str,
-) -> None:
-    frame = ET.SubElement(
-        page,
-        qn("draw", "frame"),
-        {
-            qn("draw", "style-name"): "gr1",
-            qn("draw", "name"): name,
-            qn("draw", "layer"): "layout",
-            qn("svg", "x"): x,
-            qn("svg", "y"): y,
-            qn("svg", "width"): w,
-            qn("svg", "height"): h,
-        },
-    )
-    ET.SubElement(
-        frame,
-        qn("draw", "image"),
-        {
-            qn("xlink", "href"): href,
-            qn("xlink", "type"): "simple",
-            qn("xlink", "show"): "embed",
-            qn("xlink", "actuate"): "onLoad",
-        },
+) -> str:
+    return _IMAGE_FRAME_XML.format(
+        href=xml_attr(href),
+        x=xml_attr(x),
+        y=xml_attr(y),
+        w=xml_attr(w),
+        h=xml_attr(h),
+        name=xml_attr(name),
     )
 
 
+def append_frames(page: ET._Element, frames: list[str]) -> None:
+    # One parse per slide for all newly added frames instead of a SubElement per node.
+    if not frames:
+        return
+    wrapper = ET.fromstring(_FRAGMENT_XML.format("".join(frames)))
+    page.extend(list(wrapper))
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        while chunk := fh.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def image_media_type(path: Path) -> str:
+    # Trust the file signature over the extension; fall back to the extension for SVG and others.
+    with open(path, "rb") as fh:
+        header = fh.read(8)
+    for signature, media_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return media_type
+    return IMAGE_MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+
+def copy_file_mapped(path: Path, dst: IO[bytes]) -> None:
+    with open(path, "rb") as src:
+        if os.fstat(src.fileno()).st_size == 0:
+            return
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            dst.write(view)
+
+
+def serialize_xml(root: ET._Element) -> bytes:
+    # Compact output keeps the parsed nsmap and self-closes empty elements. Tails stay
+    # intact because ODF paragraphs are whitespace-sensitive.
+    return ET.tostring(root, encoding="utf-8", xml_declaration=False, pretty_print=False)
+
+
+def zip_entry_info(
+    zout: zipfile.ZipFile,
+    name: str,
+    source: zipfile.ZipInfo | None = None,
+) -> zipfile.ZipInfo:
+    if source is None:
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.external_attr = 0o600 << 16
+    else:
+        # Keep the template member's timestamp and attributes (directory entries in particular).
+        info = zipfile.ZipInfo(name, date_time=source.date_time)
+        info.create_system = source.create_system
+        info.external_attr = source.external_attr
+    if info.is_dir():
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zout.compression
+        # ZipFile.open(info, "w") does not apply the archive's compresslevel by itself.
+        info._compresslevel = zout.compresslevel
+    return info
+
+
 def slugify(name: str) -> str:
-    name = re.sub(r"[^A-Za-z0-9._-]+", "_", name)
-    return name.strip("_") or "image"
+    return _SLUG_RE.sub("_", name).strip("_") or "image"
 
 
 def build_presentation() -> None:
@@ -350,27 +461,45 @@ def build_presentation() -> None:
 
     assert len(slides) == 20, "Expected exactly 20 slides"
 
+    # Only the two XML parts are read up front; other template members are
+    # streamed straight into the output when it is written.
     with zipfile.ZipFile(template, "r") as zin:
-        package = {name: zin.read(name) for name in zin.namelist()}
-
-    content_root = ET.fromstring(package["content.xml"])
-    manifest_root = ET.fromstring(package["META-INF/manifest.xml"])
-
-    presentation = content_root.find(qn("office", "body")).find(qn("office", "presentation"))
-    all_pages = presentation.findall(qn("draw", "page"))
+        content_root = ET.fromstring(zin.read(CONTENT_PATH))
+        manifest_root = ET.fromstring(zin.read(MANIFEST_PATH))
+
+    # Index the manifest and retype the root entry from template to ODP in the same pass.
+    manifest_index: dict[str | None, ET._Element] = {}
+    for entry in manifest_root.iterfind(_MANIFEST_FILE_ENTRY):
+        full_path = entry.get(_MANIFEST_FULL_PATH)
+        if full_path == "/":
+            entry.set(_MANIFEST_MEDIA_TYPE, "application/vnd.oasis.opendocument.presentation")
+            entry.set(_MANIFEST_VERSION, "1.2")
+        manifest_index[full_path] = entry
+
+    # Members that replace or extend the template; everything else is copied as-is.
+    package: dict[str, bytes] = {}
+    # Images are streamed from disk at write time rather than held in memory.
+    images: dict[str, Path] = {}
+
+    presentation = content_root.find(_OFFICE_BODY).find(_OFFICE_PRESENTATION)
+    all_pages = presentation.findall(_DRAW_PAGE)
     if len(all_pages) < 3:
         raise RuntimeError("Template does not contain expected page prototypes")
 
-    proto_title = all_pages[0]
-    proto_content = all_pages[1]
-    proto_closing = all_pages[2]
+    # Serialize each prototype once; re-parsing the bytes is much cheaper than deepcopy.
+    proto_title = ET.tostring(all_pages[0], with_tail=False)
+    proto_content = ET.tostring(all_pages[1], with_tail=False)
+    proto_closing = ET.tostring(all_pages[2], with_tail=False)
+    # Minimal templates carry no notes thumbnails; skip the per-slide lookup then.
+    notes_have_thumbnails = any(page.find(_NOTES_THUMBNAIL_PATH) is not None for page in all_pages[:3])
 
-    settings = presentation.find(qn("presentation", "settings"))
+    settings = presentation.find(_PRESENTATION_SETTINGS)
 
-    for page in list(presentation.findall(qn("draw", "page"))):
+    for page in list(presentation.findall(_DRAW_PAGE)):
         presentation.remove(page)
 
-    image_map: dict[str, str] = {}
+    path_to_target: dict[str, str] = {}
+    digest_to_target: dict[tuple[int, str], str] = {}
     image_counter = 1
 
     def register_image(rel_path: str) -> str:
@@ -378,125 +507,144 @@ def build_presentation() -> None:
         src = (root_dir / rel_path).resolve()
         if not src.exists():
             raise FileNotFoundError(f"Image not found: {src}")
-        if str(src) in image_map:
-            return image_map[str(src)]
+        if str(src) in path_to_target:
+            return path_to_target[str(src)]
+
+        # Identical figures copied under different names share one package member.
+        key = (src.stat().st_size, file_digest(src))
+        if key in digest_to_target:
+            path_to_target[str(src)] = digest_to_target[key]
+            return digest_to_target[key]
 
         ext = src.suffix.lower()
         safe_name = slugify(src.stem)
         target = f"Pictures/{image_counter:02d}_{safe_name}{ext}"
         image_counter += 1
 
-        package[target] = src.read_bytes()
-        image_map[str(src)] = target
-
-        media_type = mimetypes.types_map.get(ext, "application/octet-stream")
-        entry = ET.SubElement(
-            manifest_root,
-            qn("manifest", "file-entry"),
-            {
-                qn("manifest", "full-path"): target,
-                qn("manifest", "media-type"): media_type,
-            },
-        )
-        # Keep linter quiet about unused variable while still creating the node.
-        _ = entry
+        images[target] = src
+        path_to_target[str(src)] = target
+        digest_to_target[key] = target
+
+        media_type = image_media_type(src)
+        # The template may already list a member under this name; retype it rather than duplicate it.
+        entry = manifest_index.get(target)
+        if entry is not None:
+            entry.set(_MANIFEST_MEDIA_TYPE, media_type)
+        else:
+            manifest_index[target] = ET.SubElement(
+                manifest_root,
+                _MANIFEST_FILE_ENTRY,
+                {
+                    _MANIFEST_FULL_PATH: target,
+                    _MANIFEST_MEDIA_TYPE: media_type,
+                },
+            )
         return target
 
-    def make_page(i: int, spec: dict[str, object]) -> ET.Element:
+    def make_page(i: int, spec: dict[str, object]) -> ET._Element:
         layout = spec["layout"]
         if layout == "title":
-            page = copy.deepcopy(proto_title)
-            page.set(qn("draw", "style-name"), "dp1")
+            page = ET.fromstring(proto_title)
+            page.set(_DRAW_STYLE_NAME, "dp1")
         elif layout == "closing":
-            page = copy.deepcopy(proto_closing)
-            page.set(qn("draw", "style-name"), "dp3")
-            page.set(qn("draw", "master-page-name"), "Midnightblue2")
+            page = ET.fromstring(proto_closing)
+            page.set(_DRAW_STYLE_NAME, "dp3")
+            page.set(_DRAW_MASTER_PAGE_NAME, "Midnightblue2")
         else:
-            page = copy.deepcopy(proto_content)
-            page.set(qn("draw", "style-name"), "dp3")
-            page.set(qn("draw", "master-page-name"), "Midnightblue")
+            page = ET.fromstring(proto_content)
+            page.set(_DRAW_STYLE_NAME, "dp3")
+            page.set(_DRAW_MASTER_PAGE_NAME, "Midnightblue")
 
-        page.set(qn("draw", "name"), f"page{i}")
-        update_notes_page_number(page, i)
+        page.set(_DRAW_NAME, f"page{i}")
+        if notes_have_thumbnails:
+            update_notes_page_number(page, i)
 
         title = str(spec.get("title", ""))
-        set_title(page, title)
+        set_title(find_frame(page, "title"), title)
+
+        # Resolve the outline frame once; the layout branches below all reuse it.
+        outline = find_frame(page, "outline")
+        frames: list[str] = []
 
         if layout == "title":
-            set_subtitle(page, [str(x) for x in spec.get("subtitle", [])])
+            set_subtitle(find_frame(page, "subtitle"), [str(x) for x in spec.get("subtitle", [])])
         elif layout == "text":
-            set_outline(page, [str(x) for x in spec.get("bullets", [])])
+            set_outline(outline, [str(x) for x in spec.get("bullets", [])])
         elif layout == "closing":
-            add_text_frame(
-                page,
-                "Midnightblue2-outline1",
-                "outline",
-                "8.8cm",
-                "9.2cm",
-                "17.6cm",
-                "4.4cm",
-                [str(x) for x in spec.get("bullets", [])],
-                bullet=True,
+            frames.append(
+                text_frame_xml(
+                    "Midnightblue2-outline1",
+                    "outline",
+                    "8.8cm",
+                    "9.2cm",
+                    "17.6cm",
+                    "4.4cm",
+                    [str(x) for x in spec.get("bullets", [])],
+                    bullet=True,
+                )
             )
         elif layout == "mix":
-            outline = find_frame(page, "outline")
             if outline is None:
                 raise RuntimeError("Outline frame not found in mix slide")
-            outline.set(qn("svg", "x"), "1cm")
-            outline.set(qn("svg", "y"), "3.3cm")
-            outline.set(qn("svg", "width"), "11.8cm")
-            outline.set(qn("svg", "height"), "10.8cm")
-            set_paragraphs(outline, [f"• {x}" for x in spec.get("bullets", [])])
+            outline.set(_SVG_X, "1cm")
+            outline.set(_SVG_Y, "3.3cm")
+            outline.set(_SVG_WIDTH, "11.8cm")
+            outline.set(_SVG_HEIGHT, "10.8cm")
+            set_paragraphs(outline, bulleted(str(x) for x in spec.get("bullets", [])))
 
             img_rel = str(spec["image"])
             href = register_image(img_rel)
-            add_image_frame(page, href, "13.2cm", "3.3cm", "13.2cm", "10.8cm", f"img{i}")
+            frames.append(image_frame_xml(href, "13.2cm", "3.3cm", "13.2cm", "10.8cm", f"img{i}"))
         elif layout == "image":
-            remove_outline_frame(page)
+            remove_outline_frame(page, outline)
             href = register_image(str(spec["image"]))
-            add_image_frame(page, href, "1.0cm", "3.0cm", "26.0cm", "10.9cm", f"img{i}")
-            add_text_frame(
-                page,
-                "Midnightblue-outline1",
-                "outline",
-                "1.2cm",
-                "14.2cm",
-                "25.6cm",
-                "0.7cm",
-                [str(spec.get("caption", ""))],
-                bullet=False,
+            frames.append(image_frame_xml(href, "1.0cm", "3.0cm", "26.0cm", "10.9cm", f"img{i}"))
+            frames.append(
+                text_frame_xml(
+                    "Midnightblue-outline1",
+                    "outline",
+                    "1.2cm",
+                    "14.2cm",
+                    "25.6cm",
+                    "0.7cm",
+                    [str(spec.get("caption", ""))],
+                    bullet=False,
+                )
             )
         elif layout == "split":
-            remove_outline_frame(page)
+            remove_outline_frame(page, outline)
             href_l = register_image(str(spec["image_left"]))
             href_r = register_image(str(spec["image_right"]))
-            add_image_frame(page, href_l, "1.0cm", "3.2cm", "12.6cm", "9.9cm", f"img{i}_l")
-            add_image_frame(page, href_r, "14.4cm", "3.2cm", "12.6cm", "9.9cm", f"img{i}_r")
-            add_text_frame(
-                page,
-                "Midnightblue-outline1",
-                "outline",
-                "1.1cm",
-                "13.4cm",
-                "12.4cm",
-                "0.8cm",
-                [str(spec.get("caption_left", ""))],
-                bullet=False,
+            frames.append(image_frame_xml(href_l, "1.0cm", "3.2cm", "12.6cm", "9.9cm", f"img{i}_l"))
+            frames.append(image_frame_xml(href_r, "14.4cm", "3.2cm", "12.6cm", "9.9cm", f"img{i}_r"))
+            frames.append(
+                text_frame_xml(
+                    "Midnightblue-outline1",
+                    "outline",
+                    "1.1cm",
+                    "13.4cm",
+                    "12.4cm",
+                    "0.8cm",
+                    [str(spec.get("caption_left", ""))],
+                    bullet=False,
+                )
             )
-            add_text_frame(
-                page,
-                "Midnightblue-outline1",
-                "outline",
-                "14.5cm",
-                "13.4cm",
-                "12.4cm",
-                "0.8cm",
-                [str(spec.get("caption_right", ""))],
-                bullet=False,
+            frames.append(
+                text_frame_xml(
+                    "Midnightblue-outline1",
+                    "outline",
+                    "14.5cm",
+                    "13.4cm",
+                    "12.4cm",
+                    "0.8cm",
+                    [str(spec.get("caption_right", ""))],
+                    bullet=False,
+                )
             )
         else:
             raise RuntimeError(f"Unsupported layout: {layout}")
 
+        append_frames(page, frames)
         return page
 
     for idx, spec in enumerate(slides, start=1):
@@ -505,19 +653,17 @@ def build_presentation() -> None:
     if settings is not None:
         presentation.append(settings)
 
-    package["content.xml"] = ET.tostring(content_root, encoding="utf-8", xml_declaration=False)
+    package[CONTENT_PATH] = serialize_xml(content_root)
 
     # Update media types for ODP (not template)
     package["mimetype"] = b"application/vnd.oasis.opendocument.presentation"
 
-    for entry in manifest_root.findall(qn("manifest", "file-entry")):
-        if entry.get(qn("manifest", "full-path")) == "/":
-            entry.set(qn("manifest", "media-type"), "application/vnd.oasis.opendocument.presentation")
-            entry.set(qn("manifest", "version"), "1.2")
-
-    package["META-INF/manifest.xml"] = ET.tostring(manifest_root, encoding="utf-8", xml_declaration=False)
+    package[MANIFEST_PATH] = serialize_xml(manifest_root)
 
-    with zipfile.ZipFile(output, "w") as zout:
+    with (
+        zipfile.ZipFile(template, "r") as zin,
+        zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zout,
+    ):
         # ODF requires mimetype first and uncompressed.
         zout.writestr(
             zipfile.ZipInfo("mimetype"),
@@ -525,10 +671,23 @@ def build_presentation() -> None:
             compress_type=zipfile.ZIP_STORED,
         )
 
-        for name in sorted(package.keys()):
+        # Template members keep their original order; new parts and images follow.
+        for name in dict.fromkeys([*zin.namelist(), *package, *images]):
             if name == "mimetype":
                 continue
-            zout.writestr(name, package[name], compress_type=zipfile.ZIP_DEFLATED)
+            if name in package:
+                zout.writestr(zip_entry_info(zout, name), package[name])
+                continue
+            if name in images:
+                with zout.open(zip_entry_info(zout, name), "w") as dst:
+                    copy_file_mapped(images[name], dst)
+                continue
+            info = zip_entry_info(zout, name, zin.getinfo(name))
+            if info.is_dir():
+                zout.writestr(info, b"")
+                continue
+            with zin.open(name) as src, zout.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
 
     print(f"Wrote: {output}")
 